@@ -7,6 +7,7 @@ import subprocess
 import socket
 import select
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Union
 from datetime import datetime, timedelta
@@ -76,6 +77,9 @@ network_metrics = [
     "container_network_transmit_packets_total",
 ]
 
+# Number of Prometheus range queries issued concurrently per export window.
+EXPORT_QUERY_WORKERS = 8
+
 
 def time_format_transform(time):
     # transform time data from int to datetime
@@ -294,9 +298,9 @@ class PrometheusAPI:
             return {"error": f"No data found for metric {metric_name} and pod {pod}"}
         else:
             data = []
+            tz = pytz.timezone("Asia/Shanghai")
             for item in data_raw[0]["values"]:
-                date_time = datetime.fromtimestamp(int(item[0]))
-                date_time = date_time.astimezone(pytz.timezone("Asia/Shanghai"))
+                date_time = datetime.fromtimestamp(int(item[0]), tz)
                 float_value = round(
                     float(item[1]), 3
                 )  # float value is needed to be able to add it to the list as a whole.
@@ -323,13 +327,23 @@ class PrometheusAPI:
                 current_et = end_time
             else:
                 current_et = start_time + interval_time
-            for metric in normal_metrics:
-                data_raw = self.client.custom_query_range(
-                    f"{metric}{{namespace='{self.namespace}'}}",
-                    time_format_transform(start_time),
-                    time_format_transform(current_et),
-                    step=step,
+            # The per-metric queries are independent and I/O bound, so issue them
+            # concurrently; results are consumed in metric order, as before.
+            query_start = time_format_transform(start_time)
+            query_end = time_format_transform(current_et)
+            with ThreadPoolExecutor(max_workers=EXPORT_QUERY_WORKERS) as executor:
+                data_raws = list(
+                    executor.map(
+                        lambda metric: self.client.custom_query_range(
+                            f"{metric}{{namespace='{self.namespace}'}}",
+                            query_start,
+                            query_end,
+                            step=step,
+                        ),
+                        normal_metrics,
+                    )
                 )
+            for metric, data_raw in zip(normal_metrics, data_raws):
                 # Debugging print statements
                 # print(f"Query: {metric}{{namespace='{self.namespace}'}}")
                 # print(f"Start Time: {start_time}, End Time: {current_et}")
@@ -168,17 +168,17 @@ class Evaluator:
         # Initial environment response
         env_response = await self.ask_env(action)
         
-        while env_response != SubmissionStatus.VALID_SUBMISSION:
+        while env_response is not SubmissionStatus.VALID_SUBMISSION:
             action = await self.ask_agent(action_instr)
             self.sprint.agent(action)
             
             env_response = await self.ask_env(action)
             self.sprint.service(env_response)
             
-            if env_response == SubmissionStatus.VALID_SUBMISSION:
+            if env_response is SubmissionStatus.VALID_SUBMISSION:
                 print("Submission is correct!")
                 break
-            elif env_response == SubmissionStatus.INVALID_SUBMISSION:
+            elif env_response is SubmissionStatus.INVALID_SUBMISSION:
                 print("Your submission was invalid. Please continue working on the problem.")
             else:
                 action_instr = env_response
@@ -186,7 +186,7 @@ class Evaluator:
         self.session.end()
         
         # Final evaluation with the valid submission
-        if env_response == SubmissionStatus.VALID_SUBMISSION:
+        if env_response is SubmissionStatus.VALID_SUBMISSION:
             results = self.session.problem.eval(
                 self.session.solution, self.session.history, self.session.get_duration()
             )
@@ -5,6 +5,7 @@
 
 import os
 import pandas as pd
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from aiopslab.utils.actions import action, read, write
 from aiopslab.service.kubectl import KubeCtl
@@ -25,6 +26,90 @@ LOG_COMMAND_PATTERN: str = (
     r"|docker\s+(?:logs|events)"                               # docker logs/events
     r")\b(?:[^\n]*)"
 )
+_LOG_COMMAND_RE = re.compile(LOG_COMMAND_PATTERN)
+
+# Commands exec_shell refuses to run (substring -> error returned to the agent)
+EXEC_SHELL_BLOCK_LIST: dict[str, str] = {
+    "kubectl edit": "Error: Cannot use `kubectl edit`. Use `kubectl patch` instead.",
+    "edit svc": "Error: Cannot use `kubectl edit`. Use `kubectl patch` instead.",
+    "kubectl port-forward": "Error: Cannot use `kubectl port-forward` because it is an interactive command.",
+    "docker logs -f": "Error: Cannot use `docker logs -f`. Use `docker logs` instead.",
+    "kubectl logs -f": "Error: Cannot use `kubectl logs -f`. Use `kubectl logs` instead.",
+}
+
+# Column types of the CSVs written by PrometheusAPI.export_all_metrics and
+# TraceAPI.save_traces; declaring them up front skips pandas' type inference.
+_METRICS_CSV_DTYPES: dict[str, str] = {
+    "timestamp": "int64",
+    "cmdb_id": "category",
+    "kpi_name": "category",
+    "value": "float64",
+}
+_TRACES_CSV_DTYPES: dict[str, str] = {
+    "trace_id": "str",
+    "span_id": "str",
+    "parent_span": "str",
+    "service_name": "category",
+    "operation_name": "category",
+    "start_time": "int64",
+    "duration": "int64",
+    "has_error": "bool",
+}
+
+# Rendered CSV exports keyed by (absolute path, schema), tagged with the
+# (mtime, size) they were read at; re-reading the same metrics/traces file
+# across agent steps only pays the parse and render cost once. Every export is
+# written to a new timestamped path, so only the most recently used files are
+# kept.
+_CSV_CACHE_SIZE = 4
+_CSV_CACHE: OrderedDict[tuple, tuple[tuple[float, int], str]] = OrderedDict()
+
+
+def _read_csv(file_path: str, dtype: dict[str, str] | None = None) -> pd.DataFrame:
+    """Read a CSV file with the given schema, falling back to type inference.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        dtype (dict[str, str]): Expected column types (optional). Columns that
+            are absent from the file are ignored; if the file does not fit the
+            schema it is parsed with type inference instead.
+
+    Returns:
+        pd.DataFrame: The parsed CSV file.
+    """
+    try:
+        return pd.read_csv(file_path, engine="c", memory_map=True, dtype=dtype)
+    except (ValueError, TypeError):
+        return pd.read_csv(file_path, engine="c", memory_map=True)
+
+
+def _render_csv_cached(file_path: str, dtype: dict[str, str] | None = None) -> str:
+    """Render a CSV file as a table string, reusing it while the file is unchanged.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        dtype (dict[str, str]): Expected column types (optional).
+
+    Returns:
+        str: The CSV file rendered with DataFrame.to_string(index=False).
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime, stat.st_size)
+    key = (path, tuple(dtype.items()) if dtype else ())
+
+    cached = _CSV_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        _CSV_CACHE.move_to_end(key)
+        return cached[1]
+
+    text = _read_csv(path, dtype).to_string(index=False)
+    _CSV_CACHE[key] = (signature, text)
+    _CSV_CACHE.move_to_end(key)
+    while len(_CSV_CACHE) > _CSV_CACHE_SIZE:
+        _CSV_CACHE.popitem(last=False)
+    return text
+
 
 class TaskActions:
     """Base class for task actions."""
@@ -90,20 +175,13 @@ class TaskActions:
         Returns:
             str: The output of the command.
         """
-        BLOCK_LIST: dict[str, str] = {
-            "kubectl edit": "Error: Cannot use `kubectl edit`. Use `kubectl patch` instead.",
-            "edit svc": "Error: Cannot use `kubectl edit`. Use `kubectl patch` instead.",
-            "kubectl port-forward": "Error: Cannot use `kubectl port-forward` because it is an interactive command.",
-            "docker logs -f": "Error: Cannot use `docker logs -f`. Use `docker logs` instead.",
-            "kubectl logs -f": "Error: Cannot use `kubectl logs -f`. Use `kubectl logs` instead.",
-        }
-        for pattern, error in BLOCK_LIST.items():
+        for pattern, error in EXEC_SHELL_BLOCK_LIST.items():
             if pattern in command:
                 return error
 
         result = Shell.exec(command) 
 
-        if re.search(LOG_COMMAND_PATTERN, command):
+        if _LOG_COMMAND_RE.search(command):
             result = greedy_compress_lines(result)
 
         print(result)
@@ -126,8 +204,8 @@ class TaskActions:
         prometheus_url = (
             "http://localhost:32000"  # Replace with your Prometheus server URL
         )
+        # NOTE: the constructor already lists the namespace's pods and services
         prometheus_api = PrometheusAPI(prometheus_url, namespace)
-        prometheus_api.initialize_pod_and_service_lists(namespace)
 
         end_time = datetime.now()
         start_time = end_time - timedelta(minutes=duration)
@@ -156,9 +234,7 @@ class TaskActions:
             return f"error: Metrics file '{file_path}' not found."
 
         try:
-            df_metrics = pd.read_csv(file_path)
-
-            return df_metrics.to_string(index=False)
+            return _render_csv_cached(file_path, _METRICS_CSV_DTYPES)
 
         except Exception as e:
             return f"Failed to read metrics: {str(e)}"
@@ -206,9 +282,7 @@ class TaskActions:
             return f"error: Traces file '{file_path}' not found."
 
         try:
-            df_traces = pd.read_csv(file_path)
-
-            return df_traces.to_string(index=False)
+            return _render_csv_cached(file_path, _TRACES_CSV_DTYPES)
 
         except Exception as e:
             return f"Failed to read traces: {str(e)}"
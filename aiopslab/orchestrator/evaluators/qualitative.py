@@ -12,6 +12,10 @@ from aiopslab.session import SessionItem
 from aiopslab.utils.cache import LLMCache
 from aiopslab.orchestrator.evaluators.prompts import SCORER_PROMPTS
 
+# Judge scores are given as [[x]]; [x] is accepted as a fallback
+ONE_SCORE_PATTERN = re.compile(r"\[\[(\d+\.?\d*)\]\]")
+ONE_SCORE_PATTERN_BACKUP = re.compile(r"\[(\d+\.?\d*)\]")
+
 
 class LLMJudge:
     """A LLM as a judge that evaluates the quality of a solution."""
@@ -47,12 +51,9 @@ class LLMJudge:
 
     def _parse_score(self, judgement: str) -> int:
         """Parse the score from the judgement."""
-        one_score_pattern = re.compile(r"\[\[(\d+\.?\d*)\]\]")
-        one_score_pattern_backup = re.compile(r"\[(\d+\.?\d*)\]")
-
-        match = re.search(one_score_pattern, judgement)
+        match = ONE_SCORE_PATTERN.search(judgement)
         if not match:
-            match = re.search(one_score_pattern_backup, judgement)
+            match = ONE_SCORE_PATTERN_BACKUP.search(judgement)
 
         if match:
             score = ast.literal_eval(match.groups()[0])
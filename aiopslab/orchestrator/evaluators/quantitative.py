@@ -14,7 +14,7 @@ tokenizer = tiktoken.encoding_for_model(token_model)
 
 def num_steps_taken(trace: list[SessionItem]) -> int:
     """Return the number of steps taken in the trace."""
-    return len([item for item in trace if item.role == "assistant"])
+    return sum(1 for item in trace if item.role == "assistant")
 
 
 def out_tokens(trace: list[SessionItem]) -> int:
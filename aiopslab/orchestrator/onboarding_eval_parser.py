@@ -1,10 +1,11 @@
 """Custom parser for the onboarding task evaluator"""
 
-import re
 import ast
 
+from aiopslab.orchestrator.parser import CONTEXT_RE
 from aiopslab.utils.status import ResponseParsingError
 
+
 class EvalParser:
     def __init__(self):
         # Define list of known API commands that need special handling
@@ -80,8 +81,7 @@ class EvalParser:
         Returns:
             list: The extracted context.
         """
-        pattern = r"(?:```[\s\S]*?```)|(.*?)(?:(?=```)|$)"
-        matches = re.findall(pattern, response, re.DOTALL)
+        matches = CONTEXT_RE.findall(response)
         context = [match.strip() for match in matches if match.strip()]
 
         return context
@@ -17,6 +17,9 @@ import asyncio
 import atexit
 import os
 
+OPENEBS_OPERATOR_URL = "https://openebs.github.io/charts/openebs-operator.yaml"
+NEXT_ACTION_PROMPT = "Please take the next action"
+
 
 class Orchestrator:
     def __init__(self, results_dir=None):
@@ -53,13 +56,13 @@ class Orchestrator:
         if deployment != "docker":
             print("Setting up OpenEBS...")
 
-            # Install OpenEBS
-            self.kubectl.exec_command(
-                "kubectl apply -f https://openebs.github.io/charts/openebs-operator.yaml"
-            )
+            # Install OpenEBS and make openebs-hostpath the default storage
+            # class (one shell invocation for both kubectl calls)
             self.kubectl.exec_command(
+                f"kubectl apply -f {OPENEBS_OPERATOR_URL}; "
                 "kubectl patch storageclass openebs-hostpath -p '{\"metadata\": {\"annotations\":{\"storageclass.kubernetes.io/is-default-class\":\"true\"}}}'"
             )
+
             self.kubectl.wait_for_ready("openebs")
             print("OpenEBS setup completed.")
 
@@ -76,7 +79,7 @@ class Orchestrator:
         with CriticalSection():
             # inject fault
             prob.inject_fault()
-            atexit.register(exit_cleanup_fault, prob=prob)
+            _active_probs.append(prob)
 
         # Check if start_workload is async or sync
         if inspect.iscoroutinefunction(prob.start_workload):
@@ -152,7 +155,7 @@ class Orchestrator:
             dict: The final state of the session.
         """
         assert self.session is not None
-        action_instr = "Please take the next action"
+        action_instr = NEXT_ACTION_PROMPT
         action, env_response, results = "", "", {}
         self.session.start()
 
@@ -165,25 +168,26 @@ class Orchestrator:
                 env_response = await self.ask_env(action)
                 self.sprint.service(env_response)
 
-                if env_response == SubmissionStatus.VALID_SUBMISSION:
+                if env_response is SubmissionStatus.VALID_SUBMISSION:
                     break
-                elif env_response == SubmissionStatus.INVALID_SUBMISSION:
+                elif env_response is SubmissionStatus.INVALID_SUBMISSION:
                     raise ValueError("Invalid submission!")  # TODO (@manish): ask to retry?
 
-                action_instr = env_response + "\n" + "Please take the next action"
+                action_instr = f"{env_response}\n{NEXT_ACTION_PROMPT}"
         except Exception as e:
             # Make sure the fault cleanup function is unregistered
             # after recovering fault ahead because of exceptions
             with CriticalSection():
                 print("Some exception happened. Recovering the injected fault...")
                 self.session.problem.recover_fault()
-                atexit.unregister(exit_cleanup_fault)
+                if self.session.problem in _active_probs:
+                    _active_probs.remove(self.session.problem)
             raise e
 
         self.session.end()
 
         # A valid submission was made (or) max_steps reached
-        if env_response != SubmissionStatus.INVALID_SUBMISSION:
+        if env_response is not SubmissionStatus.INVALID_SUBMISSION:
             results = self.session.problem.eval(
                 self.session.solution, self.session.history, self.session.get_duration()
             )
@@ -196,7 +200,8 @@ class Orchestrator:
 
         with CriticalSection():
             self.session.problem.recover_fault()
-            atexit.unregister(exit_cleanup_fault)
+            if self.session.problem in _active_probs:
+                _active_probs.remove(self.session.problem)
             
         # Beyond recovering from fault,
         # I feel sometimes it is safer to delete the whole namespace.
@@ -207,9 +212,9 @@ class Orchestrator:
         if self.session.problem.namespace != "docker":
             self.prometheus.teardown()
             print("Uninstalling OpenEBS...")
-            self.kubectl.exec_command("kubectl delete sc openebs-hostpath openebs-device --ignore-not-found")
             self.kubectl.exec_command(
-                "kubectl delete -f https://openebs.github.io/charts/openebs-operator.yaml"
+                "kubectl delete sc openebs-hostpath openebs-device --ignore-not-found; "
+                f"kubectl delete -f {OPENEBS_OPERATOR_URL}"
             )
             self.kubectl.wait_for_namespace_deletion("openebs")
 
@@ -230,6 +235,15 @@ class Orchestrator:
         }
 
 
-def exit_cleanup_fault(prob):
-    print("Recovering fault before exit...")
-    prob.recover_fault()
+# Problems whose faults are currently injected; exit_cleanup_fault recovers
+# them if the process exits before start_problem does.
+_active_probs = []
+
+
+def exit_cleanup_fault():
+    while _active_probs:
+        print("Recovering fault before exit...")
+        _active_probs.pop().recover_fault()
+
+
+atexit.register(exit_cleanup_fault)
@@ -8,13 +8,17 @@ import ast
 
 from aiopslab.utils.status import ResponseParsingError
 
+# Compiled once; parse() runs on every agent step.
+CODE_BLOCK_RE = re.compile(r"```\s*\n(.*?)\n```", re.DOTALL)
+CONTEXT_RE = re.compile(r"(?:```[\s\S]*?```)|(.*?)(?:(?=```)|$)", re.DOTALL)
+
 
 class ResponseParser:
     def __init__(self):
         pass
 
     def validate(self, response: str):
-        actions = re.findall(r"```\s*\n(.*?)\n```", response, re.DOTALL)
+        actions = CODE_BLOCK_RE.findall(response)
         if len(actions) != 1:
             raise ResponseParsingError("""
 Format validation failure. Only have one pair of three ticks in your block and check the ticks. 
@@ -78,8 +82,7 @@ exec_shell("kubectl get services --all-namespaces")
         Returns:
             list: The extracted context.
         """
-        pattern = r"(?:```[\s\S]*?```)|(.*?)(?:(?=```)|$)"
-        matches = re.findall(pattern, response, re.DOTALL)
+        matches = CONTEXT_RE.findall(response)
         context = [match.strip() for match in matches if match.strip()]
 
         return context
@@ -218,10 +218,12 @@ class ProblemRegistry:
             "flower_node_stop-detection": FlowerNodeStopDetection,
             "flower_model_misconfig-detection": FlowerModelMisconfigDetection,
         }
-        self.DOCKER_REGISTRY = [
-            "flower_node_stop-detection",
-            "flower_model_misconfig-detection",
-        ]
+        self.DOCKER_REGISTRY = frozenset(
+            [
+                "flower_node_stop-detection",
+                "flower_model_misconfig-detection",
+            ]
+        )
 
     def get_problem_instance(self, problem_id: str):
         if problem_id not in self.PROBLEM_REGISTRY:
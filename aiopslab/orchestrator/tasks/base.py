@@ -1,16 +1,12 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
-from aiopslab.config import Config
-from aiopslab.paths import BASE_DIR
+from aiopslab.paths import config
 from aiopslab.service.kubectl import KubeCtl
 from aiopslab.orchestrator.evaluators.quantitative import *
 from aiopslab.orchestrator.evaluators.qualitative import LLMJudge
 
 
-config = Config(BASE_DIR / "config.yml")
-
-
 class Task:
     """Base class for all tasks."""
 
@@ -2,6 +2,7 @@
 # Licensed under the MIT License.
 
 import importlib
+from functools import lru_cache
 
 
 def action(method):
@@ -61,22 +62,25 @@ def get_actions(task: str, subtype: str | None = None) -> dict:
     Returns:
         dict: A dictionary of actions for the given task.
     """
+    # Copy so callers cannot mutate the cached mapping
+    return dict(_discover_actions(task, subtype))
+
+
+@lru_cache(maxsize=None)
+def _discover_actions(task: str, subtype: str | None = None) -> dict:
+    """Introspect the task's action class; cached as the classes are static."""
     class_name = task.title() + "Actions"
     module = importlib.import_module("aiopslab.orchestrator.actions." + task)
     class_obj = getattr(module, class_name)
 
-    actions = {
-        method: getattr(class_obj, method).__doc__.strip()
-        for method in dir(class_obj)
-        if callable(getattr(class_obj, method))
-        and getattr(getattr(class_obj, method), "is_action", False)
-    }
-
-    if subtype:
-        actions = {
-            method: doc
-            for method, doc in actions.items()
-            if getattr(getattr(class_obj, method), "action_type", None) == subtype
-        }
+    # Resolve each attribute once and apply both filters in the same pass
+    actions = {}
+    for name in dir(class_obj):
+        method = getattr(class_obj, name)
+        if not callable(method) or not getattr(method, "is_action", False):
+            continue
+        if subtype and getattr(method, "action_type", None) != subtype:
+            continue
+        actions[name] = method.__doc__.strip()
 
     return actions
@@ -0,0 +1,25 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+"""Event loop entry point shared by the CLI, service and clients."""
+
+import asyncio
+
+
+def run(main):
+    """Run a coroutine to completion on a new event loop.
+
+    Uses uvloop's event loop when the optional `uvloop` extra is installed and
+    the standard asyncio loop otherwise.
+
+    Args:
+        main: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
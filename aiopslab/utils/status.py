@@ -6,10 +6,7 @@
 from enum import Enum
 from colorama import Fore, Style
 
-from aiopslab.config import Config
-from aiopslab.paths import BASE_DIR
-
-config = Config(BASE_DIR / "config.yml")
+from aiopslab.paths import config
 
 
 class SubmissionStatus(Enum):
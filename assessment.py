@@ -15,6 +15,7 @@ from rich.panel import Panel
 from prompt_toolkit.completion import WordCompleter
 
 from aiopslab.onboarding_evaluator import Evaluator
+from aiopslab.utils import event_loop
 
 
 WELCOME = """
@@ -136,4 +137,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
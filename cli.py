@@ -14,6 +14,7 @@ from rich.panel import Panel
 from prompt_toolkit.completion import WordCompleter
 
 from aiopslab.orchestrator import Orchestrator
+from aiopslab.utils import event_loop
 
 
 WELCOME = """
@@ -138,4 +139,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
@@ -1,12 +1,12 @@
 """Main runner for AIOpsLab agents."""
 
 import os
-import asyncio
 import argparse
 
 import wandb
 from aiopslab.orchestrator import Orchestrator
 from aiopslab.orchestrator.problems.registry import ProblemRegistry
+from aiopslab.utils import event_loop
 from clients.registry import AgentRegistry
 
 def parse_args():
@@ -88,7 +88,7 @@ if __name__ == "__main__":
     # Override with environment variable if set
     use_wandb = os.getenv("USE_WANDB", "false").lower() == "true"
     
-    asyncio.run(run_agent(
+    event_loop.run(run_agent(
         agent_name=args.agent,
         problem_id=args.problem_id,
         max_steps=args.max_steps,
@@ -1,6 +1,5 @@
 # This is a naive implementation of Flash without tool and TSG.
 
-import asyncio
 import json
 import os
 import logging
@@ -10,6 +9,7 @@ from pydantic import BaseModel
 from clients.utils.llm import GPTClient
 from aiopslab.orchestrator import Orchestrator
 from aiopslab.orchestrator.problems.registry import ProblemRegistry
+from aiopslab.utils import event_loop
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -170,7 +170,7 @@ if __name__ == "__main__":
             problem_desc, instructs, apis = orchestrator.init_problem(pid)
             flash_agent.init_context(problem_desc, instructs, apis)
 
-            full_output = asyncio.run(orchestrator.start_problem(max_steps=30))
+            full_output = event_loop.run(orchestrator.start_problem(max_steps=30))
             results = full_output.get("results", {})
             
             filename = os.path.join("results", f"flash_{pid}.json")
@@ -7,11 +7,11 @@ Code: https://openai.com/index/gpt-4-research/
 Paper: https://arxiv.org/abs/2303.08774
 """
 import os
-import asyncio
 import tiktoken
 import wandb
 from aiopslab.orchestrator import Orchestrator
 from aiopslab.orchestrator.problems.registry import ProblemRegistry
+from aiopslab.utils import event_loop
 from clients.utils.llm import GPTClient
 from dotenv import load_dotenv
 
@@ -119,7 +119,7 @@ if __name__ == "__main__":
 
         problem_desc, instructs, apis = orchestrator.init_problem(pid)
         agent.init_context(problem_desc, instructs, apis)
-        asyncio.run(orchestrator.start_problem(max_steps=30))
+        event_loop.run(orchestrator.start_problem(max_steps=30))
 
     if use_wandb:
         # Finish the wandb run
@@ -8,10 +8,10 @@ Paper: https://arxiv.org/abs/2303.08774
 """
 
 import sys
-import asyncio
 import os
 
 from aiopslab.orchestrator import Orchestrator
+from aiopslab.utils import event_loop
 from clients.utils.llm import GPTClient
 from clients.utils.templates import DOCS_SHELL_ONLY
 
@@ -85,4 +85,4 @@ if __name__ == "__main__":
     pid = "misconfig_app_hotel_res-mitigation-1"
     problem_desc, instructs, apis = orchestrator.init_problem(pid)
     agent.init_context(problem_desc, instructs, apis)
-    asyncio.run(orchestrator.start_problem(max_steps=10))
+    event_loop.run(orchestrator.start_problem(max_steps=10))
@@ -2,9 +2,9 @@
 Naive LLaMA client (with shell access) for AIOpsLab.
 """
 
-import asyncio
 
 from aiopslab.orchestrator import Orchestrator
+from aiopslab.utils import event_loop
 from clients.utils.llm import LLaMAClient
 from clients.utils.templates import DOCS
 
@@ -63,4 +63,4 @@ if __name__ == "__main__":
     pid = "flower_model_misconfig-detection"
     problem_desc, instructs, apis = orchestrator.init_problem(pid)
     agent.init_context(problem_desc, instructs, apis)
-    asyncio.run(orchestrator.start_problem(max_steps=10))
+    event_loop.run(orchestrator.start_problem(max_steps=10))
@@ -5,7 +5,6 @@ More info: https://openrouter.ai/
 """
 
 import os
-import asyncio
 import tiktoken
 import wandb
 import argparse
@@ -13,6 +12,7 @@ import json
 from pathlib import Path
 from aiopslab.orchestrator import Orchestrator
 from aiopslab.orchestrator.problems.registry import ProblemRegistry
+from aiopslab.utils import event_loop
 from clients.utils.llm import OpenRouterClient
 from clients.utils.templates import DOCS_SHELL_ONLY
 from dotenv import load_dotenv
@@ -215,7 +215,7 @@ if __name__ == "__main__":
 
         problem_desc, instructs, apis = orchestrator.init_problem(pid)
         agent.init_context(problem_desc, instructs, apis)
-        asyncio.run(orchestrator.start_problem(max_steps=args.max_steps))
+        event_loop.run(orchestrator.start_problem(max_steps=args.max_steps))
 
     if use_wandb:
         # Finish the wandb run
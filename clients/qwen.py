@@ -2,10 +2,10 @@
 """
 
 import os
-import asyncio
 
 import wandb
 from aiopslab.orchestrator import Orchestrator
+from aiopslab.utils import event_loop
 from clients.utils.llm import QwenClient
 from clients.utils.templates import DOCS_SHELL_ONLY
 
@@ -71,7 +71,7 @@ if __name__ == "__main__":
     pid = "misconfig_app_hotel_res-mitigation-1"
     problem_desc, instructs, apis = orchestrator.init_problem(pid)
     agent.init_context(problem_desc, instructs, apis)
-    asyncio.run(orchestrator.start_problem(max_steps=10))
+    event_loop.run(orchestrator.start_problem(max_steps=10))
 
     if use_wandb:
         # Finish the wandb run
@@ -7,11 +7,11 @@ Code: https://github.com/ysymyth/ReAct
 Paper: https://arxiv.org/abs/2210.03629
 """
 
-import asyncio
 import json
 import tiktoken
 from aiopslab.orchestrator import Orchestrator
 from aiopslab.orchestrator.problems.registry import ProblemRegistry
+from aiopslab.utils import event_loop
 from clients.utils.llm import GPTClient
 from clients.utils.templates import DOCS
 
@@ -119,7 +119,7 @@ if __name__ == "__main__":
             problem_desc, instructs, apis = orchestrator.init_problem(pid)
             agent.init_context(problem_desc, instructs, apis)
 
-            full_output = asyncio.run(orchestrator.start_problem(max_steps=30))
+            full_output = event_loop.run(orchestrator.start_problem(max_steps=30))
             results = full_output.get("results", {})
 
             filename = f"react_{pid}.json"
@@ -1,10 +1,10 @@
-import asyncio
 import os
 import time
 
 import wandb
 from aiopslab.orchestrator import Orchestrator
 from aiopslab.orchestrator.problems.registry import ProblemRegistry
+from aiopslab.utils import event_loop
 from clients.utils.llm import vLLMClient
 from clients.utils.templates import DOCS_SHELL_ONLY
 
@@ -88,7 +88,7 @@ if __name__ == "__main__":
             print("*"*30)
             problem_desc, instructs, apis = orchestrator.init_problem(pid)
             agent.init_context(problem_desc, instructs, apis)
-            asyncio.run(orchestrator.start_problem(max_steps=10))
+            event_loop.run(orchestrator.start_problem(max_steps=10))
             print("*"*30)
             print(f"Successfully processed pid {pid}.")
             print("*"*30)
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import os
 import traceback
@@ -10,6 +9,7 @@ from pydantic import BaseModel
 
 from aiopslab.orchestrator import Orchestrator
 from aiopslab.orchestrator.problems.registry import ProblemRegistry
+from aiopslab.utils import event_loop
 from clients.registry import AgentRegistry
 
 # Set up logging
@@ -149,7 +149,7 @@ def simulate(req: SimulationRequest):
     try:
         problem_desc, instructs, apis = orchestrator.init_problem(pid)
         agent.init_context(problem_desc, instructs, apis)
-        asyncio.run(orchestrator.start_problem(max_steps=max_steps))
+        event_loop.run(orchestrator.start_problem(max_steps=max_steps))
         
         raw = orchestrator.session.to_dict()
         raw["trace"].insert(0, {"role": "system", "content": agent.system_message})
@@ -0,0 +1,54 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+import unittest
+from datetime import datetime
+
+from aiopslab.observer.log_api import parse_log_timestamp
+
+STRPTIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+class TestParseLogTimestamp(unittest.TestCase):
+    def test_fraction_digits(self):
+        for fraction in ["1", "12", "123", "1234", "12345", "123456", "000001"]:
+            timestamp = f"2024-02-29T23:59:58.{fraction}Z"
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(
+                    parse_log_timestamp(timestamp),
+                    datetime.strptime(timestamp, STRPTIME_FORMAT),
+                )
+
+    def test_result_is_naive(self):
+        self.assertIsNone(parse_log_timestamp("2024-01-01T12:00:00.123Z").tzinfo)
+
+    def test_long_fraction_falls_back_to_strptime(self):
+        for timestamp in ["2024-01-01T12:00:00.1234567Z", "2024-01-01T12:00:00.123456789Z"]:
+            with self.subTest(timestamp=timestamp):
+                with self.assertRaises(ValueError):
+                    datetime.strptime(timestamp, STRPTIME_FORMAT)
+                with self.assertRaises(ValueError):
+                    parse_log_timestamp(timestamp)
+
+    def test_malformed(self):
+        for timestamp in [
+            "",
+            "garbage",
+            "2024-01-01T12:00:00Z",
+            "2024-01-01T12:00:00.Z",
+            "2024-01-01T12:00:00.123",
+            "2024-01-01 12:00:00.123Z",
+            "2024-01-01T12:00:00.123+00:00",
+            "2024-13-01T12:00:00.123Z",
+            "2023-02-29T12:00:00.123Z",
+            "2024-01-01T12:00:00.12a4Z",
+        ]:
+            with self.subTest(timestamp=timestamp):
+                with self.assertRaises(ValueError):
+                    datetime.strptime(timestamp, STRPTIME_FORMAT)
+                with self.assertRaises(ValueError):
+                    parse_log_timestamp(timestamp)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+
+import os
+import tempfile
+import unittest
+
+from aiopslab.orchestrator.actions import base
+
+
+class TestCsvCache(unittest.TestCase):
+    def setUp(self):
+        base._CSV_CACHE.clear()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write_csv(self, name, text, mode="w"):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, mode) as f:
+            f.write(text)
+        return path
+
+    def test_refreshed_after_append(self):
+        path = self.write_csv(
+            "metrics.csv",
+            "timestamp,cmdb_id,kpi_name,value\n1,pod-a,cpu,0.5\n",
+        )
+        text = base._render_csv_cached(path, base._METRICS_CSV_DTYPES)
+        self.assertIn("pod-a", text)
+        self.assertNotIn("pod-b", text)
+        self.assertIs(base._render_csv_cached(path, base._METRICS_CSV_DTYPES), text)
+
+        self.write_csv("metrics.csv", "2,pod-b,mem,1.5\n", mode="a")
+        text = base._render_csv_cached(path, base._METRICS_CSV_DTYPES)
+        self.assertIn("pod-a", text)
+        self.assertIn("pod-b", text)
+
+    def test_falls_back_to_inference(self):
+        path = self.write_csv(
+            "metrics.csv",
+            "timestamp,cmdb_id,kpi_name,value\n2024-01-01,pod-a,cpu,high\n",
+        )
+        df = base._read_csv(path, base._METRICS_CSV_DTYPES)
+        self.assertEqual(df["timestamp"].tolist(), ["2024-01-01"])
+        self.assertEqual(df["value"].tolist(), ["high"])
+        self.assertIn("high", base._render_csv_cached(path, base._METRICS_CSV_DTYPES))
+
+    def test_cache_is_bounded(self):
+        for i in range(base._CSV_CACHE_SIZE + 3):
+            path = self.write_csv(f"metrics_{i}.csv", "timestamp,value\n1,0.5\n")
+            base._render_csv_cached(path, base._METRICS_CSV_DTYPES)
+        self.assertEqual(len(base._CSV_CACHE), base._CSV_CACHE_SIZE)
+        self.assertIn(os.path.abspath(path), [key[0] for key in base._CSV_CACHE])
+
+
+if __name__ == "__main__":
+    unittest.main()